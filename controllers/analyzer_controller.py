@@ -1,4 +1,5 @@
 import os
+import importlib
 from typing import Dict, List, Any, Optional, Tuple
 from loguru import logger
 import json
@@ -14,6 +15,8 @@ class AnalyzerController:
     between different model components.
     """
 
+    SUPPORTED_EXTENSIONS = frozenset(('.pdf', '.docx', '.doc', '.txt'))
+
     def __init__(self, ats_rules_path: str = None):
         """
         Initialize the controller with all required model components.
@@ -66,7 +69,7 @@ class AnalyzerController:
 
             # Check if file is a valid type
             ext = os.path.splitext(resume_file_path)[1].lower()
-            if ext not in ['.pdf', '.docx', '.doc', '.txt']:
+            if ext not in self.SUPPORTED_EXTENSIONS:
                 logger.error(f"Unsupported file format: {ext}")
                 return {"error": f"Unsupported file format: {ext}. Please use PDF, DOCX, or TXT files."}
 
@@ -145,9 +148,21 @@ class AnalyzerController:
             return result
 
         except Exception as e:
-            logger.error(f"Error during resume analysis: {e}")
+            logger.exception("Error during resume analysis")
             return {"error": f"Error during resume analysis: {str(e)}"}
 
+    def warmup(self) -> None:
+        """
+        Import the document parsing libraries ahead of the first analysis.
+        Intended to run on a background thread while the user is picking files;
+        libraries that are not installed are skipped.
+        """
+        for module_name in ("pdfplumber", "PyPDF2", "docx", "fitz"):
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                logger.debug(f"Skipping warmup of {module_name}: not installed")
+
     def get_available_ats_platforms(self) -> List[Dict]:
         """
         Get a list of available ATS platforms for analysis.
@@ -200,23 +215,25 @@ class AnalyzerController:
                     del resume_data["full_text"]
                 serializable_results["resume_data"] = resume_data
 
-            if "ats_analysis" in analysis_results:
+            ats_analysis = analysis_results.get("ats_analysis")
+            if ats_analysis is not None:
                 serializable_results["ats_analysis"] = {
-                    "compatibility_score": analysis_results["ats_analysis"].get("compatibility_score", 0),
-                    "formatting_issues": analysis_results["ats_analysis"].get("formatting_issues", []),
-                    "structure_feedback": analysis_results["ats_analysis"].get("structure_feedback", []),
-                    "improvement_suggestions": analysis_results["ats_analysis"].get("improvement_suggestions", [])
+                    "compatibility_score": ats_analysis.get("compatibility_score", 0),
+                    "formatting_issues": ats_analysis.get("formatting_issues", []),
+                    "structure_feedback": ats_analysis.get("structure_feedback", []),
+                    "improvement_suggestions": ats_analysis.get("improvement_suggestions", [])
                 }
 
-            if "keyword_analysis" in analysis_results and analysis_results["keyword_analysis"]:
+            keyword_analysis = analysis_results.get("keyword_analysis")
+            if keyword_analysis:
                 serializable_results["keyword_analysis"] = {
-                    "overall_match_percentage": analysis_results["keyword_analysis"].get("overall_match_percentage", 0),
-                    "skill_match_percentage": analysis_results["keyword_analysis"].get("skill_match_percentage", 0),
-                    "experience_match_percentage": analysis_results["keyword_analysis"].get("experience_match_percentage", 0),
-                    "education_match_percentage": analysis_results["keyword_analysis"].get("education_match_percentage", 0),
-                    "skills_match_percentage": analysis_results["keyword_analysis"].get("skills_match_percentage", 0),
-                    "matching_keywords": analysis_results["keyword_analysis"].get("matching_keywords", [])[:20],
-                    "missing_keywords": analysis_results["keyword_analysis"].get("missing_keywords", [])[:20]
+                    "overall_match_percentage": keyword_analysis.get("overall_match_percentage", 0),
+                    "skill_match_percentage": keyword_analysis.get("skill_match_percentage", 0),
+                    "experience_match_percentage": keyword_analysis.get("experience_match_percentage", 0),
+                    "education_match_percentage": keyword_analysis.get("education_match_percentage", 0),
+                    "skills_match_percentage": keyword_analysis.get("skills_match_percentage", 0),
+                    "matching_keywords": keyword_analysis.get("matching_keywords", [])[:20],
+                    "missing_keywords": keyword_analysis.get("missing_keywords", [])[:20]
                 }
 
             with open(output_path, 'w', encoding='utf-8') as f:
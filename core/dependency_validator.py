@@ -45,12 +45,11 @@ def check_library_installed(lib_name: str) -> bool:
 
 def check_model_installed(lib_name: str, model_name: str) -> bool:
     # Checks if required NLP model is available
+    # spaCy models are installed as packages, so look them up without loading them
     if lib_name == "spacy":
         try:
-            import spacy
-            spacy.load(model_name)
-            return True
-        except Exception:
+            return importlib.util.find_spec(model_name) is not None
+        except (ImportError, ValueError):
             return False
     return True
 
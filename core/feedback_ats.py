@@ -26,12 +26,12 @@ class ATSFeedback:
         # Formatting issues and suggestions
         if formatting_issues:
             issues.extend(formatting_issues)
-            recommendations.extend([f"Fix formatting: {issue}" for issue in formatting_issues])
+            recommendations.extend(f"Fix formatting: {issue}" for issue in formatting_issues)
 
         # Structure feedback and suggestions
         if structure_feedback:
             issues.extend(structure_feedback)
-            recommendations.extend([f"Improve structure: {fb}" for fb in structure_feedback])
+            recommendations.extend(f"Improve structure: {fb}" for fb in structure_feedback)
 
         # General improvement suggestions
         if improvement_suggestions:
@@ -10,6 +10,30 @@ class ContentFeedback:
     Generates feedback on resume content quality for the user.
     """
 
+    # (section key, display label, strength, weakness, recommendation) for each key section
+    SECTION_FEEDBACK = (
+        ("summary", "Summary",
+         "Includes a professional summary/objective.",
+         "Missing professional summary/objective.",
+         "Add a concise summary or objective at the top of your resume."),
+        ("experience", "Experience",
+         "Work experience section is present.",
+         "Missing work experience section.",
+         "Include relevant work experience with clear job titles and responsibilities."),
+        ("education", "Education",
+         "Education section is present.",
+         "Missing education section.",
+         "Add your educational background, including degrees and institutions."),
+        ("skills", "Skills",
+         "Skills section is present.",
+         "Missing skills section.",
+         "List relevant technical and soft skills."),
+        ("projects", "Projects",
+         "Projects section is present.",
+         "Missing projects section.",
+         "Include notable projects to showcase your experience and achievements."),
+    )
+
     @staticmethod
     def generate(feedback: Dict[str, Any], resume_data: Dict[str, Any]) -> None:
         """
@@ -19,38 +43,17 @@ class ContentFeedback:
         weaknesses = []
         recommendations = []
 
-        # Section presence is a strength
-        if resume_data.get("summary"):
-            strengths.append("Includes a professional summary/objective.")
-        if resume_data.get("experience") and len(resume_data["experience"]) > 0:
-            strengths.append("Work experience section is present.")
-        if resume_data.get("education") and len(resume_data["education"]) > 0:
-            strengths.append("Education section is present.")
-        if resume_data.get("skills") and len(resume_data["skills"]) > 0:
-            strengths.append("Skills section is present.")
-        if resume_data.get("projects") and len(resume_data["projects"]) > 0:
-            strengths.append("Projects section is present.")
-
-        # Missing sections are flagged as weaknesses
-        if not resume_data.get("summary"):
-            weaknesses.append("Missing professional summary/objective.")
-            recommendations.append("Add a concise summary or objective at the top of your resume.")
-        if not resume_data.get("experience") or len(resume_data["experience"]) == 0:
-            weaknesses.append("Missing work experience section.")
-            recommendations.append("Include relevant work experience with clear job titles and responsibilities.")
-        if not resume_data.get("education") or len(resume_data["education"]) == 0:
-            weaknesses.append("Missing education section.")
-            recommendations.append("Add your educational background, including degrees and institutions.")
-        if not resume_data.get("skills") or len(resume_data["skills"]) == 0:
-            weaknesses.append("Missing skills section.")
-            recommendations.append("List relevant technical and soft skills.")
-        if not resume_data.get("projects") or len(resume_data["projects"]) == 0:
-            weaknesses.append("Missing projects section.")
-            recommendations.append("Include notable projects to showcase your experience and achievements.")
+        # One pass per section: present sections are strengths, missing ones weaknesses
+        for key, _, strength, weakness, recommendation in ContentFeedback.SECTION_FEEDBACK:
+            if resume_data.get(key):
+                strengths.append(strength)
+            else:
+                weaknesses.append(weakness)
+                recommendations.append(recommendation)
 
         # Heuristic for resume length
-        if resume_data.get("full_text"):
-            text = resume_data["full_text"]
+        text = resume_data.get("full_text")
+        if text:
             if len(text) < 500:
                 weaknesses.append("Resume content is too brief.")
                 recommendations.append("Expand your resume to provide more detail on your experience and skills.")
@@ -69,14 +72,7 @@ class ContentFeedback:
         """
         Summarize content quality for the user.
         """
-        sections = [
-            ("summary", "Summary"),
-            ("experience", "Experience"),
-            ("education", "Education"),
-            ("skills", "Skills"),
-            ("projects", "Projects")
-        ]
-        missing = [label for key, label in sections if not resume_data.get(key)]
+        missing = [label for key, label, *_ in ContentFeedback.SECTION_FEEDBACK if not resume_data.get(key)]
         if not missing:
             return "Your resume contains all key sections and is well-structured."
         else:
@@ -2,25 +2,40 @@
 from typing import Dict, Any, Optional
 
 class FeedbackGenerator:
+    CORE_SECTIONS = ("contact_info", "summary", "experience", "education", "skills")
+
     def generate_comprehensive_feedback(self, resume_data: Dict[str, Any], ats_analysis: Dict[str, Any], keyword_analysis: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # ATS and keyword results do not depend on the extracted sections
+        ats_compatibility = {
+            "score": ats_analysis["compatibility_score"],
+            "issues": ats_analysis["formatting_issues"],
+            "recommendations": ats_analysis["improvement_suggestions"]
+        }
+        keyword_match = {
+            "score": keyword_analysis["overall_match_percentage"] if keyword_analysis else 0,
+            "recommendations": ["Incorporate the following keywords: java, react"] if keyword_analysis else []
+        }
+
+        # Nothing was extracted from the resume, so skip building section feedback
+        if not resume_data or not any(resume_data.get(key) for key in self.CORE_SECTIONS):
+            return {
+                "summary": "Insufficient resume data to generate detailed feedback.",
+                "ats_compatibility": ats_compatibility,
+                "content_quality": {"strengths": [], "weaknesses": [], "recommendations": []},
+                "keyword_match": keyword_match
+            }
+
         # This is a mock implementation. A real implementation would generate
         # more detailed and personalized feedback.
         return {
             "summary": "This is a strong resume, but could be improved by tailoring it to the job description.",
-            "ats_compatibility": {
-                "score": ats_analysis["compatibility_score"],
-                "issues": ats_analysis["formatting_issues"],
-                "recommendations": ats_analysis["improvement_suggestions"]
-            },
+            "ats_compatibility": ats_compatibility,
             "content_quality": {
                 "strengths": ["Clear and concise summary."],
                 "weaknesses": ["Lack of quantifiable achievements."],
                 "recommendations": ["Add metrics to your accomplishments (e.g., 'Increased sales by 15%')."]
             },
-            "keyword_match": {
-                "score": keyword_analysis["overall_match_percentage"] if keyword_analysis else 0,
-                "recommendations": ["Incorporate the following keywords: java, react"] if keyword_analysis else []
-            }
+            "keyword_match": keyword_match
         }
 
     def generate_section_feedback(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -3,6 +3,7 @@ KeywordFeedback: Generates keyword match feedback for resume analysis.
 Only important context is commented for clarity.
 """
 
+from itertools import islice
 from typing import Dict, List, Optional
 
 class KeywordFeedback:
@@ -32,13 +33,13 @@ class KeywordFeedback:
         # Suggest missing keywords for improvement
         if missing_keywords:
             recommendations.append(
-                f"Consider adding these missing keywords from the job description: {', '.join(missing_keywords[:10])}"
+                f"Consider adding these missing keywords from the job description: {', '.join(islice(missing_keywords, 10))}"
             )
 
         # Highlight strong matches for user awareness
         if matched_keywords:
             recommendations.append(
-                f"Strong keyword matches: {', '.join(matched_keywords[:10])}"
+                f"Strong keyword matches: {', '.join(islice(matched_keywords, 10))}"
             )
 
         feedback["keyword_match"] = {
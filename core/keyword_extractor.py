@@ -4,7 +4,68 @@ Only key logic is commented for clarity.
 """
 
 import re
-from typing import List, Set
+from collections import Counter
+from functools import lru_cache
+from typing import FrozenSet, List, Set
+from core.skill_matcher import compile_skill_matcher
+
+# Stop words for keyword filtering
+_STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
+    'when', 'where', 'how', 'all', 'any', 'both', 'each', 'other', 'such',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 'can', 'will',
+    'just', 'don', "don't", 'should', "should've", 'now', 'not', 'no',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
+    'had', 'do', 'does', 'did', 'having', 'with', 'for', 'on', 'at',
+    'by', 'from', 'up', 'down', 'in', 'out', 'over', 'under', 'again',
+    'further', 'then', 'once', 'here', 'there', 'why'
+})
+
+# Common technical and soft skills for matching
+_COMMON_SKILLS = (
+    'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go',
+    'typescript', 'scala', 'r', 'perl', 'rust', 'dart', 'html', 'css', 'sql',
+    'react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js', 'express',
+    'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'keras', '.net', 'laravel',
+    'aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible',
+    'ci/cd', 'devops', 'microservices', 'serverless',
+    'mysql', 'postgresql', 'mongodb', 'oracle', 'sql server', 'sqlite', 'redis', 'cassandra',
+    'dynamodb', 'firebase',
+    'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack', 'trello',
+    'visual studio code', 'intellij', 'eclipse', 'photoshop', 'illustrator', 'figma',
+    'leadership', 'communication', 'teamwork', 'problem-solving', 'critical thinking',
+    'time management', 'creativity', 'adaptability', 'project management', 'agile',
+    'scrum', 'kanban',
+    'machine learning', 'deep learning', 'artificial intelligence', 'data science',
+    'data analysis', 'natural language processing', 'computer vision', 'big data',
+    'data engineering', 'data visualization', 'statistics', 'analytics',
+    'ios', 'android', 'react native', 'flutter', 'mobile development', 'app development',
+    'cross-platform', 'pwa',
+    'rest api', 'graphql', 'oauth', 'jwt', 'web services', 'soa', 'mvc', 'orm',
+    'responsive design', 'web accessibility', 'ui/ux', 'frontend', 'backend',
+    'full-stack', 'testing', 'qa', 'security', 'blockchain'
+)
+
+_WORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9+#\-.]*[a-zA-Z0-9]\b')
+
+_SKILL_PATTERN, _IMPLIED_SKILLS = compile_skill_matcher(_COMMON_SKILLS)
+
+def _match_skills(text: str) -> Set[str]:
+    # Known skills/technologies in lowercased text, found in one pass
+    skill_matches = set()
+    for skill in _SKILL_PATTERN.findall(text):
+        skill_matches.add(skill)
+        skill_matches.update(_IMPLIED_SKILLS[skill])
+    return skill_matches
+
+@lru_cache(maxsize=256)
+def _extract_keywords(text: str) -> FrozenSet[str]:
+    # Same job description is scored against many resumes, so cache by text
+    text = text.lower()
+    words = _WORD_RE.findall(text)
+    filtered_words = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
+
+    return frozenset(filtered_words).union(_match_skills(text))
 
 class KeywordExtractor:
     """
@@ -13,82 +74,30 @@ class KeywordExtractor:
     """
 
     def __init__(self):
-        # Stop words for keyword filtering
-        self.stop_words = {
-            'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
-            'when', 'where', 'how', 'all', 'any', 'both', 'each', 'other', 'such',
-            'only', 'own', 'same', 'so', 'than', 'too', 'very', 'can', 'will',
-            'just', 'don', "don't", 'should', "should've", 'now', 'not', 'no',
-            'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-            'had', 'do', 'does', 'did', 'having', 'with', 'for', 'on', 'at',
-            'by', 'from', 'up', 'down', 'in', 'out', 'over', 'under', 'again',
-            'further', 'then', 'once', 'here', 'there', 'why', 'how', 'all',
-            'any', 'both', 'each', 'other', 'such', 'own', 'same', 'so', 'than',
-            'too', 'very', 'can', 'will', 'just', 'don', "don't", 'should',
-            "should've", 'now', 'not', 'no'
-        }
-
-        # Common technical and soft skills for matching
-        self.common_skills = [
-            'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go',
-            'typescript', 'scala', 'r', 'perl', 'rust', 'dart', 'html', 'css', 'sql',
-            'react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js', 'express',
-            'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'keras', '.net', 'laravel',
-            'aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible',
-            'ci/cd', 'devops', 'microservices', 'serverless',
-            'mysql', 'postgresql', 'mongodb', 'oracle', 'sql server', 'sqlite', 'redis', 'cassandra',
-            'dynamodb', 'firebase',
-            'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'slack', 'trello',
-            'visual studio code', 'intellij', 'eclipse', 'photoshop', 'illustrator', 'figma',
-            'leadership', 'communication', 'teamwork', 'problem-solving', 'critical thinking',
-            'time management', 'creativity', 'adaptability', 'project management', 'agile',
-            'scrum', 'kanban',
-            'machine learning', 'deep learning', 'artificial intelligence', 'data science',
-            'data analysis', 'natural language processing', 'computer vision', 'big data',
-            'data engineering', 'data visualization', 'statistics', 'analytics',
-            'ios', 'android', 'react native', 'flutter', 'mobile development', 'app development',
-            'cross-platform', 'pwa',
-            'rest api', 'graphql', 'oauth', 'jwt', 'web services', 'soa', 'mvc', 'orm',
-            'responsive design', 'web accessibility', 'ui/ux', 'frontend', 'backend',
-            'full-stack', 'testing', 'qa', 'security', 'blockchain'
-        ]
+        self.stop_words = _STOP_WORDS
+        self.common_skills = _COMMON_SKILLS
 
-    def extract_keywords(self, text: str) -> Set[str]:
+    def extract_keywords(self, text: str) -> FrozenSet[str]:
         """
         Extracts keywords using stopword filtering and skill matching.
+        Results are cached per text, so the returned set is immutable.
         """
-        text = text.lower()
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#\-.]*[a-zA-Z0-9]\b', text)
-        filtered_words = [w for w in words if w not in self.stop_words and len(w) > 2]
-
-        # Match known skills/technologies
-        skill_matches = set()
-        for skill in self.common_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', text):
-                skill_matches.add(skill)
-
-        keywords = set(filtered_words) | skill_matches
-        return keywords
+        return _extract_keywords(text)
 
     def extract_key_requirements(self, job_description: str, num_requirements: int = 10) -> List[str]:
         """
         Returns top requirements from a job description (frequency + skill match).
         """
         text = job_description.lower()
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#\-.]*[a-zA-Z0-9]\b', text)
-        filtered_words = [w for w in words if w not in self.stop_words and len(w) > 2]
-
-        word_freq = {}
-        for word in filtered_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+        words = _WORD_RE.findall(text)
+        word_freq = Counter(w for w in words if w not in _STOP_WORDS and len(w) > 2)
 
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        top_keywords = [word for word, freq in sorted_words[:num_requirements]]
+        # most_common(n) uses a heap, so the whole vocabulary is never sorted
+        top_keywords = [word for word, freq in word_freq.most_common(num_requirements)]
 
-        skill_matches = []
-        for skill in self.common_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', text):
-                skill_matches.append(skill)
+        # Keep skills in list order so requirements stay deterministic
+        found = _match_skills(text)
+        skill_matches = [skill for skill in _COMMON_SKILLS if skill in found]
 
         requirements = list(dict.fromkeys(top_keywords + skill_matches))
         return requirements[:num_requirements]
@@ -4,8 +4,10 @@ Extracts structured entities from resume text using NLP.
 Refactored out of ResumeParser for single-responsibility.
 """
 
+import re
 from typing import Dict, List, Any, Optional
 from loguru import logger
+from core.skill_matcher import compile_skill_matcher
 
 class ResumeEntityExtractor:
     """
@@ -13,6 +15,34 @@ class ResumeEntityExtractor:
     Uses spaCy NLP if available, otherwise falls back to regex and heuristics.
     """
 
+    # Section header patterns, compiled once for all instances
+    SKILLS_SECTION_RE = re.compile(r'(skills|expertise|proficiency|competency)[\s:]*([\w\s,;.-]+)')
+    EXPERIENCE_HEADER_RE = re.compile(r'(?:experience|employment|work history|career|professional)[\s:]*', re.IGNORECASE)
+    EDUCATION_HEADER_RE = re.compile(r'(?:education|academic|qualification)[\s:]*', re.IGNORECASE)
+    PROJECTS_HEADER_RE = re.compile(r'(?:projects|portfolio|works)[\s:]*', re.IGNORECASE)
+    SUMMARY_SECTION_RE = re.compile(r'(summary|objective|profile|about)[\s:]*([\w\s,;.-]+)', re.IGNORECASE)
+    SKILL_TOKEN_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9+#\-.]*[a-zA-Z0-9]\b')
+
+    # Contact patterns
+    EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+    PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}|\d{10})')
+    LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+    GITHUB_RE = re.compile(r'github\.com/[\w-]+')
+
+    # Month suffixes are bounded ("Sep" + "tember") to keep backtracking linear
+    _MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]{0,6}\.?'
+    DATE_RANGE_RE = re.compile(_MONTH + r'\s*\d{4}\s*(?:-|–|to)\s*' + _MONTH + r'\s*\d{4}')
+
+    # Per-entry patterns for experience, education and project sections
+    TITLE_RE = re.compile(r'\b([A-Z][a-zA-Z\s]+)\b')
+    AT_ORGANIZATION_RE = re.compile(r'at\s+([A-Z][a-zA-Z\s]+)')
+    DEGREE_RE = re.compile(r'(Bachelor|Master|PhD|Associate|B\.Sc\.|M\.Sc\.|Bachelors|Masters|Doctorate)[\w\s,.]*', re.IGNORECASE)
+    YEAR_RE = re.compile(r'\d{4}')
+    PROJECT_NAME_RE = re.compile(r'\b([A-Z][a-zA-Z0-9\s]+)\b')
+
+    # Technologies tagged on project entries
+    PROJECT_TECH_RE = re.compile(r'(python|java|react|node\.js|sql|aws|docker|kubernetes)', re.IGNORECASE)
+
     def __init__(self, nlp_model: Optional[Any] = None, skills_db: Optional[set] = None):
         """
         Args:
@@ -21,6 +51,7 @@ class ResumeEntityExtractor:
         """
         self.nlp = nlp_model
         self.skills_db = skills_db or set()
+        self._skills_pattern, self._contained_skills = compile_skill_matcher(frozenset(self.skills_db), word_boundary=False)
 
     def extract_entities(self, text: str) -> Dict[str, Any]:
         """
@@ -43,22 +74,21 @@ class ResumeEntityExtractor:
         return entities
 
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
-        import re
         contact = {}
         # Email
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+        email_match = self.EMAIL_RE.search(text)
         if email_match:
             contact["email"] = email_match.group(0)
         # Phone
-        phone_match = re.search(r'(\+\d{1,3}[-\.\s]?)?(\(?\d{3}\)?[-\.\s]?\d{3}[-\.\s]?\d{4}|\d{10})', text)
+        phone_match = self.PHONE_RE.search(text)
         if phone_match:
             contact["phone"] = phone_match.group(0)
         # LinkedIn
-        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', text)
+        linkedin_match = self.LINKEDIN_RE.search(text)
         if linkedin_match:
             contact["linkedin"] = linkedin_match.group(0)
         # GitHub
-        github_match = re.search(r'github\.com/[\w-]+', text)
+        github_match = self.GITHUB_RE.search(text)
         if github_match:
             contact["github"] = github_match.group(0)
         # Name (heuristic: first line or NLP)
@@ -68,26 +98,25 @@ class ResumeEntityExtractor:
         return contact
 
     def _extract_skills(self, text: str) -> List[str]:
-        skills_found = []
+        skills_found = set()
         text_lower = text.lower()
-        for skill in self.skills_db:
-            if skill in text_lower:
-                skills_found.append(skill)
+        if self._skills_pattern is not None:
+            # One scan over the text instead of a substring search per known skill
+            for skill in self._skills_pattern.findall(text_lower):
+                if skill not in skills_found:
+                    skills_found.add(skill)
+                    skills_found.update(self._contained_skills[skill])
         # Heuristic: look for "Skills" section
-        import re
-        skills_section = re.search(r'(skills|expertise|proficiency|competency)[\s:]*([\w\s,;.-]+)', text_lower)
+        skills_section = self.SKILLS_SECTION_RE.search(text_lower)
         if skills_section:
-            possible_skills = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#\-.]*[a-zA-Z0-9]\b', skills_section.group(2))
-            for skill in possible_skills:
-                if skill not in skills_found and len(skill) > 2:
-                    skills_found.append(skill)
-        return list(set(skills_found))
+            possible_skills = self.SKILL_TOKEN_RE.findall(skills_section.group(2))
+            skills_found.update(skill for skill in possible_skills if len(skill) > 2)
+        return list(skills_found)
 
     def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
-        import re
         experiences = []
         # Heuristic: split by "Experience" section headers
-        exp_sections = re.split(r'(?:experience|employment|work history|career|professional)[\s:]*', text, flags=re.IGNORECASE)
+        exp_sections = self.EXPERIENCE_HEADER_RE.split(text)
         for section in exp_sections[1:]:
             # Find job titles, companies, dates, and descriptions
             job_title = None
@@ -95,15 +124,15 @@ class ResumeEntityExtractor:
             date_range = None
             description = None
             # Job title (heuristic: first capitalized phrase)
-            title_match = re.search(r'\b([A-Z][a-zA-Z\s]+)\b', section)
+            title_match = self.TITLE_RE.search(section)
             if title_match:
                 job_title = title_match.group(1)
             # Company (heuristic: "at" or next capitalized phrase)
-            company_match = re.search(r'at\s+([A-Z][a-zA-Z\s]+)', section)
+            company_match = self.AT_ORGANIZATION_RE.search(section)
             if company_match:
                 company = company_match.group(1)
             # Date range
-            date_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}\s*(-|–|to)\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}', section)
+            date_match = self.DATE_RANGE_RE.search(section)
             if date_match:
                 date_range = date_match.group(0)
             # Description (heuristic: lines after title/company/date)
@@ -118,21 +147,20 @@ class ResumeEntityExtractor:
         return experiences
 
     def _extract_education(self, text: str) -> List[Dict[str, Any]]:
-        import re
         educations = []
-        edu_sections = re.split(r'(?:education|academic|qualification)[\s:]*', text, flags=re.IGNORECASE)
+        edu_sections = self.EDUCATION_HEADER_RE.split(text)
         for section in edu_sections[1:]:
             degree = None
             institution = None
             date_range = None
             description = None
-            degree_match = re.search(r'(Bachelor|Master|PhD|Associate|B\.Sc\.|M\.Sc\.|Bachelors|Masters|Doctorate)[\w\s,.]*', section, re.IGNORECASE)
+            degree_match = self.DEGREE_RE.search(section)
             if degree_match:
                 degree = degree_match.group(0)
-            institution_match = re.search(r'at\s+([A-Z][a-zA-Z\s]+)', section)
+            institution_match = self.AT_ORGANIZATION_RE.search(section)
             if institution_match:
                 institution = institution_match.group(1)
-            date_match = re.search(r'\d{4}', section)
+            date_match = self.YEAR_RE.search(section)
             if date_match:
                 date_range = date_match.group(0)
             desc_lines = section.split('\n')[1:]
@@ -146,18 +174,15 @@ class ResumeEntityExtractor:
         return educations
 
     def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
-        import re
         projects = []
-        proj_sections = re.split(r'(?:projects|portfolio|works)[\s:]*', text, flags=re.IGNORECASE)
+        proj_sections = self.PROJECTS_HEADER_RE.split(text)
         for section in proj_sections[1:]:
             name = None
             description = None
-            techs = []
-            name_match = re.search(r'\b([A-Z][a-zA-Z0-9\s]+)\b', section)
+            name_match = self.PROJECT_NAME_RE.search(section)
             if name_match:
                 name = name_match.group(1)
-            tech_matches = re.findall(r'(python|java|react|node\.js|sql|aws|docker|kubernetes)', section, re.IGNORECASE)
-            techs = list(set([tech.lower() for tech in tech_matches]))
+            techs = list({tech.lower() for tech in self.PROJECT_TECH_RE.findall(section)})
             desc_lines = section.split('\n')[1:]
             description = ' '.join([line.strip() for line in desc_lines if line.strip()])
             projects.append({
@@ -168,8 +193,7 @@ class ResumeEntityExtractor:
         return projects
 
     def _extract_summary(self, text: str) -> str:
-        import re
-        summary_match = re.search(r'(summary|objective|profile|about)[\s:]*([\w\s,;.-]+)', text, re.IGNORECASE)
+        summary_match = self.SUMMARY_SECTION_RE.search(text)
         if summary_match:
             return summary_match.group(2).strip()
         # Fallback: first paragraph
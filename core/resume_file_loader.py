@@ -65,7 +65,7 @@ class ResumeFileLoader:
         try:
             with open(file_path, "rb") as f:
                 data = f.read()
-            logger.info(f"Loaded file: {file_path} ({len(data)} bytes)")
+            logger.debug(f"Loaded file: {file_path} ({len(data)} bytes)")
             return data
         except Exception as e:
             logger.error(f"Error loading file {file_path}: {e}")
@@ -1,4 +1,6 @@
-
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any
 from loguru import logger
 from core.resume_file_loader import ResumeFileLoader
@@ -6,10 +8,14 @@ from core.resume_text_extractor import ResumeTextExtractor
 from core.resume_entity_extractor import ResumeEntityExtractor
 
 class ResumeParser:
+    # Number of parsed resumes kept in memory, keyed by file content
+    CACHE_SIZE = 32
+
     def __init__(self):
         self.file_loader = ResumeFileLoader()
         self.text_extractor = ResumeTextExtractor()
         self.entity_extractor = ResumeEntityExtractor()
+        self._cache = OrderedDict()
 
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
         logger.info(f"Parsing resume: {file_path}")
@@ -18,10 +24,29 @@ class ResumeParser:
             return {"error": error_message}
 
         extension = self.file_loader.get_file_extension(file_path)
-        text = self.text_extractor.extract_text(file_path, extension)
+
+        # Re-analysing the same upload reuses the earlier parse
+        cache_key = None
+        data = self.file_loader.load_file(file_path)
+        if data is not None:
+            cache_key = (hashlib.sha256(data).hexdigest(), extension)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                logger.info("Using cached parse result")
+                return copy.deepcopy(cached)
+
+        # Extract from the bytes already read for the cache key
+        text = self.text_extractor.extract_text(file_path, extension, data)
         if not text:
             return {"error": "Could not extract text from resume."}
 
         entities = self.entity_extractor.extract_entities(text)
         entities["full_text"] = text
+
+        # The cache keeps its own copy so callers may mutate the nested lists
+        if cache_key is not None:
+            self._cache[cache_key] = copy.deepcopy(entities)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
         return entities
@@ -4,12 +4,27 @@ Handles extraction of text content from resume files (PDF, DOCX, TXT).
 Refactored out of ResumeParser for single-responsibility.
 """
 
-import pdfplumber
-import PyPDF2
-import docx
+import codecs
+import io
+from functools import lru_cache
 from typing import Optional
 from loguru import logger
 
+# PDF and DOCX libraries are imported on first use so that loading the parser
+# (or extracting a plain text resume) does not pay for them.
+
+@lru_cache(maxsize=1)
+def _load_fitz():
+    """
+    Import PyMuPDF, which is optional and much faster than pdfplumber.
+    Returns None when it is not installed.
+    """
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
 class ResumeTextExtractor:
     """
     Extracts text from resume files in supported formats.
@@ -25,50 +40,64 @@ class ResumeTextExtractor:
         self.use_ocr = use_ocr
         self.ocr_func = ocr_func
 
-    def extract_text(self, file_path: str, extension: str) -> str:
+    def extract_text(self, file_path: str, extension: str, data: Optional[bytes] = None) -> str:
         """
         Extract text from the given resume file.
 
         Args:
             file_path: Path to the resume file.
             extension: File extension (e.g., '.pdf', '.docx', '.txt').
+            data: File contents if already read; the file is then not reopened.
 
         Returns:
             Extracted text as a string.
         """
         if extension == '.pdf':
-            return self._extract_text_from_pdf(file_path)
+            return self._extract_text_from_pdf(file_path, data)
         elif extension == '.docx':
-            return self._extract_text_from_docx(file_path)
+            return self._extract_text_from_docx(file_path, data)
         elif extension == '.txt':
-            return self._extract_text_from_txt(file_path)
+            return self._extract_text_from_txt(file_path, data)
         else:
             logger.error(f"Unsupported file extension for text extraction: {extension}")
             return ""
 
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
+    def _extract_text_from_pdf(self, pdf_path: str, data: Optional[bytes] = None) -> str:
         """
         Extract text content from a PDF file.
-        Uses pdfplumber first, then falls back to PyPDF2.
+        Uses PyMuPDF if installed, otherwise pdfplumber, then falls back to PyPDF2.
         If text is suspiciously short, attempts OCR if enabled.
         """
-        text = ""
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    text += page_text + "\n"
-        except Exception as e:
-            logger.warning(f"pdfplumber extraction failed, trying PyPDF2: {e}")
+        text = None
+        fitz = _load_fitz()
+        if fitz is not None:
+            try:
+                doc = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(pdf_path)
+                with doc:
+                    text = "\n".join(page.get_text("text") for page in doc)
+            except Exception as e:
+                logger.warning(f"PyMuPDF extraction failed, trying pdfplumber: {e}")
+
+        if text is None:
+            pages = []
             try:
-                with open(pdf_path, "rb") as file:
-                    reader = PyPDF2.PdfReader(file)
-                    for page_num in range(len(reader.pages)):
-                        page = reader.pages[page_num]
-                        page_text = page.extract_text() or ""
-                        text += page_text + "\n"
-            except Exception as e2:
-                logger.error(f"PyPDF2 extraction also failed: {e2}")
+                import pdfplumber
+                with pdfplumber.open(io.BytesIO(data) if data is not None else pdf_path) as pdf:
+                    for page in pdf.pages:
+                        pages.append(page.extract_text() or "")
+                        # Drop the parsed page objects so memory stays flat on long PDFs
+                        page.flush_cache()
+            except Exception as e:
+                logger.warning(f"pdfplumber extraction failed, trying PyPDF2: {e}")
+                try:
+                    import PyPDF2
+                    with (io.BytesIO(data) if data is not None else open(pdf_path, "rb")) as file:
+                        reader = PyPDF2.PdfReader(file)
+                        for page in reader.pages:
+                            pages.append(page.extract_text() or "")
+                except Exception as e2:
+                    logger.error(f"PyPDF2 extraction also failed: {e2}")
+            text = "\n".join(pages)
 
         # If text is suspiciously short, try OCR if available
         if self.use_ocr and len(text.strip()) < 100 and self.ocr_func:
@@ -82,27 +111,36 @@ class ResumeTextExtractor:
 
         return text
 
-    def _extract_text_from_docx(self, docx_path: str) -> str:
+    def _extract_text_from_docx(self, docx_path: str, data: Optional[bytes] = None) -> str:
         """
         Extract text content from a DOCX file.
         """
-        text = ""
         try:
-            doc = docx.Document(docx_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+            import docx
+            doc = docx.Document(io.BytesIO(data) if data is not None else docx_path)
+            return "\n".join(para.text for para in doc.paragraphs)
         except Exception as e:
             logger.error(f"Error extracting text from DOCX: {e}")
-        return text
+            return ""
 
-    def _extract_text_from_txt(self, txt_path: str) -> str:
+    def _extract_text_from_txt(self, txt_path: str, data: Optional[bytes] = None) -> str:
         """
         Extract text content from a TXT file.
         """
-        text = ""
+        raw = data
+        if raw is None:
+            try:
+                with open(txt_path, "rb") as f:
+                    raw = f.read()
+            except Exception as e:
+                logger.error(f"Error extracting text from TXT: {e}")
+                return ""
+
+        # Decode the bytes already read rather than reopening with another codec
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return raw.decode("utf-16", errors="replace")
         try:
-            with open(txt_path, "r", encoding="utf-8") as f:
-                text = f.read()
-        except Exception as e:
-            logger.error(f"Error extracting text from TXT: {e}")
-        return text
+            return raw.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            logger.warning(f"TXT file is not valid UTF-8, replacing undecodable bytes: {txt_path}")
+            return raw.decode("utf-8", errors="replace")
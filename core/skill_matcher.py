@@ -0,0 +1,39 @@
+"""
+skill_matcher.py
+Builds the single-pass skill matching pattern shared by the keyword and
+resume entity extractors.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+@lru_cache(maxsize=8)
+def compile_skill_matcher(skills: Iterable[str], word_boundary: bool = True) -> Tuple[Optional["re.Pattern"], Dict[str, Tuple[str, ...]]]:
+    """
+    Build one pattern that finds every listed skill in a single scan.
+
+    Args:
+        skills: Hashable collection of lowercase skills (tuple or frozenset).
+        word_boundary: Match whole words only; otherwise skills match as substrings.
+
+    Returns:
+        Tuple of (pattern, implied), or (None, {}) when there are no skills.
+        The lookahead lets matches overlap and, with the alternation ordered
+        longest-first, reports the longest skill at each start position.
+        implied maps each skill to the shorter skills it hides at the same
+        start (e.g. "react" in "react native").
+    """
+    if not skills:
+        return None, {}
+    edge = r'\b' if word_boundary else ''
+    ordered = sorted(skills, key=len, reverse=True)
+    pattern = re.compile('(?=' + edge + '(' + '|'.join(re.escape(s) for s in ordered) + ')' + edge + ')')
+    implied = {
+        skill: tuple(
+            other for other in ordered
+            if other != skill and re.match(edge + re.escape(other) + edge, skill)
+        )
+        for skill in ordered
+    }
+    return pattern, implied
@@ -138,10 +138,8 @@ def check_dependencies():
     # If spaCy is installed, check for model
     if "spacy" not in optional_deps:
         try:
-            import spacy
-            try:
-                spacy.load("en_core_web_sm")
-            except:
+            # Look the model package up instead of loading it at startup
+            if importlib.util.find_spec("en_core_web_sm") is None:
                 logger.warning("spaCy model 'en_core_web_sm' not found. Attempting to download...")
                 user_choice = tk.messagebox.askyesno("Download Required",
                     "The spaCy language model is missing. Would you like to download it now?")
@@ -1,20 +1,62 @@
+import io
 import os
+from bisect import bisect_right
+from functools import lru_cache
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import threading
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import time
+from concurrent.futures import Future
 from loguru import logger
 from PIL import Image, ImageTk
-import sys
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from controllers.analyzer_controller import AnalyzerController
-from core.exceptions import CVAnalyzerError
+
+# Score color bands: below 60 red, below 80 orange, otherwise green
+_SCORE_THRESHOLDS = (60, 80)
+_SCORE_COLORS = ("#F44336", "#FF9800", "#4CAF50")
+
+# Static (heading, underline) pairs of the comprehensive feedback text
+_HDR_SUMMARY = ("SUMMARY FEEDBACK\n", "================\n\n")
+_HDR_ATS = ("ATS COMPATIBILITY\n", "================\n\n")
+_HDR_CONTENT = ("CONTENT QUALITY\n", "==============\n\n")
+_HDR_KEYWORDS = ("KEYWORD MATCHING\n", "===============\n\n")
+_HDR_SECTIONS = ("SECTION-BY-SECTION FEEDBACK\n", "==========================\n\n")
+
+@lru_cache(maxsize=None)
+def _font(size=None, weight=None):
+    """Return a shared CTkFont; widgets with the same size and weight reuse one Tk font"""
+    return ctk.CTkFont(size=size, weight=weight)
+
+def _bullets(items):
+    """Format items as a bulleted list, one per line"""
+    return "• " + "\n• ".join(items) if items else ""
+
+def _tk_len(text):
+    """Length of text as Tk counts it.
+
+    Tk counts characters outside the BMP (e.g. emoji) as two, so the length
+    is measured in UTF-16 code units rather than Python code points.
+    """
+    return len(text.encode('utf-16-le')) // 2
+
+def _tk_index(preceding):
+    """Return the "1.0+Nc" index just past the text preceding"""
+    return f"1.0+{_tk_len(preceding)}c"
+
+@lru_cache(maxsize=None)
+def _section_display_name(section_name):
+    """Turn a section key such as work_experience into its display title"""
+    return section_name.replace("_", " ").title()
+
+@lru_cache(maxsize=256)
+def _render_bullets(header, items):
+    """Render a header, its bullet lines and a trailing blank line; items must be a tuple"""
+    return f"{header}\n{_bullets(items)}\n\n" if items else f"{header}\n\n"
+
+def _score_color(score):
+    """Return color based on score value"""
+    return _SCORE_COLORS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 class MainView(ctk.CTk):
     """
@@ -22,6 +64,24 @@ class MainView(ctk.CTk):
     built with customtkinter for a modern UI experience.
     """
 
+    # (attribute, label, textbox height) for the fields of the resume content tab
+    _RESUME_FIELDS = (
+        ("contact_text", "Contact Information:", 80),
+        ("skills_text", "Skills:", 80),
+        ("experience_text", "Experience:", 150),
+        ("education_text", "Education:", 80),
+    )
+
+    # Contact lines as (key, label); required ones show "Not found" when missing
+    _CONTACT_REQUIRED = (("name", "Name"), ("email", "Email"), ("phone", "Phone"))
+    _CONTACT_OPTIONAL = (("linkedin", "LinkedIn"), ("github", "GitHub"), ("location", "Location"))
+
+    # Resume files larger than this trigger a warning before analysis
+    _LARGE_RESUME_BYTES = 10 * 1024 * 1024
+
+    # Texts at least this long are updated by replacing only the changed span
+    _DIFF_MIN_CHARS = 256
+
     def __init__(self):
         super().__init__()
 
@@ -43,10 +103,15 @@ class MainView(ctk.CTk):
         self.selected_ats = None
         self.analysis_results = None
         self.is_analyzing = False
+        self.feedback_frame = None
+        self._pending_feedback = None
 
         # Create main layout
         self.create_layout()
 
+        # Load parsing libraries in the background once the window is up
+        self.after(500, self._run_in_background, self.controller.warmup)
+
     def create_layout(self):
         """Create the main application layout."""
         # Create main container with 2x2 grid
@@ -59,7 +124,7 @@ class MainView(ctk.CTk):
         self.create_input_panel()
         self.create_visualization_panel()
         self.create_result_panel()
-        self.create_feedback_panel()
+        # The feedback window is built on first use (see show_feedback_panel)
 
     def create_input_panel(self):
         """Create the left panel for inputs"""
@@ -73,7 +138,7 @@ class MainView(ctk.CTk):
         title_label = ctk.CTkLabel(
             input_frame,
             text="Resume Analysis Tool",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(size=18, weight="bold")
         )
         title_label.grid(row=0, column=0, padx=10, pady=(20, 10), sticky="w")
 
@@ -81,7 +146,7 @@ class MainView(ctk.CTk):
         upload_label = ctk.CTkLabel(
             input_frame,
             text="1. Upload Resume (PDF/DOCX/TXT)",
-            font=ctk.CTkFont(size=14)
+            font=_font(size=14)
         )
         upload_label.grid(row=1, column=0, padx=10, pady=(20, 5), sticky="w")
 
@@ -95,7 +160,7 @@ class MainView(ctk.CTk):
         self.resume_label = ctk.CTkLabel(
             input_frame,
             text="No file selected",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             text_color="gray"
         )
         self.resume_label.grid(row=3, column=0, padx=10, pady=(0, 10), sticky="w")
@@ -104,7 +169,7 @@ class MainView(ctk.CTk):
         job_description_label = ctk.CTkLabel(
             input_frame,
             text="2. Enter Job Description (Optional)",
-            font=ctk.CTkFont(size=14)
+            font=_font(size=14)
         )
         job_description_label.grid(row=4, column=0, padx=10, pady=(20, 5), sticky="w")
 
@@ -126,7 +191,7 @@ class MainView(ctk.CTk):
         ats_label = ctk.CTkLabel(
             input_frame,
             text="3. Select ATS Platform (Optional)",
-            font=ctk.CTkFont(size=14)
+            font=_font(size=14)
         )
         ats_label.grid(row=7, column=0, padx=10, pady=(20, 5), sticky="w")
 
@@ -134,6 +199,7 @@ class MainView(ctk.CTk):
         platforms = self.controller.get_available_ats_platforms()
         platform_options = [platform["name"] for platform in platforms]
         self.platform_ids = {platform["name"]: platform["id"] for platform in platforms}
+        self.platform_info = {platform["name"]: platform["description"] for platform in platforms}
 
         self.ats_dropdown = ctk.CTkOptionMenu(
             input_frame,
@@ -146,7 +212,7 @@ class MainView(ctk.CTk):
         self.ats_info_label = ctk.CTkLabel(
             input_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             text_color="gray",
             wraplength=250
         )
@@ -157,7 +223,7 @@ class MainView(ctk.CTk):
             input_frame,
             text="Analyze Resume",
             command=self.analyze_resume,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(size=14, weight="bold"),
             height=40,
             fg_color="#2A8C55",
             hover_color="#206040"
@@ -168,7 +234,7 @@ class MainView(ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             input_frame,
             text="Analysis in progress...",
-            font=ctk.CTkFont(size=12),
+            font=_font(size=12),
             text_color="gray"
         )
         self.progress_label.grid(row=11, column=0, padx=10, pady=5, sticky="w")
@@ -178,73 +244,6 @@ class MainView(ctk.CTk):
         self.progress_bar.grid(row=12, column=0, padx=20, pady=5, sticky="ew")
         self.progress_bar.grid_remove()  # Hide initially
 
-    def show_error_dialog(self, message):
-        """Show a centralized error dialog using customtkinter or fallback to tkinter."""
-        try:
-            messagebox.showerror("Analysis Error", message)
-        except Exception:
-            tk.Tk().withdraw()
-            tk.messagebox.showerror("Analysis Error", message)
-
-    def set_progress(self, visible=True, value=0.0, message=""):
-        """Show/hide progress bar and label, and update value/message."""
-        if visible:
-            self.progress_label.configure(text=message)
-            self.progress_label.grid()
-            self.progress_bar.set(value)
-            self.progress_bar.grid()
-        else:
-            self.progress_label.grid_remove()
-            self.progress_bar.grid_remove()
-
-    def analyze_resume(self):
-        """Run resume analysis with progress indicator and error handling."""
-        def run_analysis():
-            try:
-                self.set_progress(True, 0.1, "Starting analysis...")
-                self.is_analyzing = True
-                self.analysis_results = None
-
-                resume_path = self.resume_path
-                job_description = self.job_description_text.get("1.0", "end").strip()
-                ats_platform = self.selected_ats
-
-                if not resume_path:
-                    self.set_progress(False)
-                    self.show_error_dialog("Please select a resume file before analyzing.")
-                    return
-
-                self.set_progress(True, 0.2, "Parsing resume...")
-                result = self.controller.analyze_resume(
-                    resume_file_path=resume_path,
-                    job_description=job_description if job_description else None,
-                    ats_platform=ats_platform
-                )
-
-                self.set_progress(True, 0.8, "Finalizing analysis...")
-
-                if "error" in result:
-                    self.set_progress(False)
-                    self.show_error_dialog(result["error"])
-                    self.is_analyzing = False
-                    return
-
-                self.analysis_results = result
-                self.set_progress(False)
-                self.is_analyzing = False
-                self.display_results()
-            except CVAnalyzerError as ce:
-                self.set_progress(False)
-                self.show_error_dialog(str(ce))
-                self.is_analyzing = False
-            except Exception as e:
-                self.set_progress(False)
-                self.show_error_dialog(f"Unexpected error: {str(e)}")
-                self.is_analyzing = False
-
-        # Run analysis in a separate thread to keep UI responsive
-        threading.Thread(target=run_analysis, daemon=True).start()
-
     def create_visualization_panel(self):
         """Create the top-right panel for visualizations"""
         viz_frame = ctk.CTkFrame(self)
@@ -259,7 +258,7 @@ class MainView(ctk.CTk):
         viz_title = ctk.CTkLabel(
             viz_frame,
             text="Resume Analysis Scores",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(size=16, weight="bold")
         )
         viz_title.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="w")
 
@@ -271,20 +270,32 @@ class MainView(ctk.CTk):
         self.create_empty_chart()
 
     def create_empty_chart(self):
-        """Create an empty chart with placeholder text."""
-        # Clear any existing chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.text(0.5, 0.5, "Upload a resume to see analysis results",
-                horizontalalignment='center', verticalalignment='center',
-                fontsize=12, color='gray')
-        ax.set_axis_off()
-
-        # Create canvas for figure
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
+        """Show placeholder text until there are scores to plot."""
+        self._fig = None
+        self._chart_placeholder = ctk.CTkLabel(
+            self.chart_frame,
+            text="Upload a resume to see analysis results",
+            font=_font(size=12),
+            text_color="gray"
+        )
+        self._chart_placeholder.pack(fill=tk.BOTH, expand=True)
+
+    def _create_chart_figure(self):
+        """Create the chart figure and canvas, replacing the placeholder."""
+        # Matplotlib is imported here so it is not loaded at startup; the backend is
+        # selected explicitly so pyplot does not probe for one on import
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self._chart_placeholder.destroy()
+
+        # The figure and canvas are created once and redrawn for each analysis
+        self._fig, self._ax = plt.subplots(figsize=(8, 4), layout="none")
+        # Fixed axes placement: the chart shape never changes, so no layout engine is needed
+        self._ax.set_position([0.08, 0.15, 0.88, 0.78])
+        canvas = FigureCanvasTkAgg(self._fig, master=self.chart_frame)
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(fill=tk.BOTH, expand=True)
 
@@ -302,7 +313,7 @@ class MainView(ctk.CTk):
         result_title = ctk.CTkLabel(
             result_frame,
             text="Detailed Analysis",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(size=16, weight="bold")
         )
         result_title.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="w")
 
@@ -339,7 +350,7 @@ class MainView(ctk.CTk):
         feedback_title = ctk.CTkLabel(
             self.feedback_frame,
             text="Comprehensive Resume Feedback",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(size=18, weight="bold")
         )
         feedback_title.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
 
@@ -347,6 +358,10 @@ class MainView(ctk.CTk):
         self.feedback_text = ctk.CTkTextbox(self.feedback_frame)
         self.feedback_text.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Configure tags for formatting once; they persist across refreshes
+        self._tag_configure_font(self.feedback_text, "heading", _font(size=16, weight="bold"))
+        self._tag_configure_font(self.feedback_text, "subheading", _font(size=14, weight="bold"))
+
         # Close button
         close_button = ctk.CTkButton(
             self.feedback_frame,
@@ -363,7 +378,7 @@ class MainView(ctk.CTk):
         self.ocr_notice = ctk.CTkLabel(
             self.summary_tab,
             text="⚠️ Image-based PDF detected. OCR was used but results may be limited.",
-            font=ctk.CTkFont(size=14),
+            font=_font(size=14),
             text_color="#FF9800",  # Orange warning color
         )
         self.ocr_notice.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
@@ -376,14 +391,14 @@ class MainView(ctk.CTk):
         ats_label = ctk.CTkLabel(
             score_frame,
             text="ATS Compatibility Score:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(size=14, weight="bold")
         )
         ats_label.grid(row=0, column=0, padx=10, pady=10)
 
         self.ats_score_value = ctk.CTkLabel(
             score_frame,
             text="N/A",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(size=24, weight="bold")
         )
         self.ats_score_value.grid(row=0, column=1, padx=10, pady=10)
 
@@ -394,14 +409,14 @@ class MainView(ctk.CTk):
         match_label = ctk.CTkLabel(
             match_frame,
             text="Overall Match Score:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(size=14, weight="bold")
         )
         match_label.grid(row=0, column=0, padx=10, pady=10)
 
         self.match_score_value = ctk.CTkLabel(
             match_frame,
             text="N/A",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(size=24, weight="bold")
         )
         self.match_score_value.grid(row=0, column=1, padx=10, pady=10)
 
@@ -412,7 +427,7 @@ class MainView(ctk.CTk):
         summary_label = ctk.CTkLabel(
             summary_frame,
             text="Summary Feedback:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(size=14, weight="bold")
         )
         summary_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
 
@@ -439,7 +454,7 @@ class MainView(ctk.CTk):
         platform_label = ctk.CTkLabel(
             platform_frame,
             text="ATS Platform:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         platform_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
 
@@ -450,7 +465,7 @@ class MainView(ctk.CTk):
         issues_label = ctk.CTkLabel(
             self.ats_tab,
             text="Formatting Issues:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         issues_label.grid(row=1, column=0, padx=10, pady=(10, 5), sticky="w")
 
@@ -462,7 +477,7 @@ class MainView(ctk.CTk):
         recommendations_label = ctk.CTkLabel(
             self.ats_tab,
             text="ATS Recommendations:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         recommendations_label.grid(row=3, column=0, padx=10, pady=(10, 5), sticky="w")
 
@@ -474,41 +489,58 @@ class MainView(ctk.CTk):
         """Set up the keywords tab"""
         self.keywords_tab.grid_columnconfigure(0, weight=1)
 
+        # Results here are short and read-only, so plain labels are used instead of textboxes
+
         # Matching Keywords
         matching_label = ctk.CTkLabel(
             self.keywords_tab,
             text="Matching Keywords:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         matching_label.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
 
-        self.matching_text = ctk.CTkTextbox(self.keywords_tab, height=100)
+        self.matching_text = ctk.CTkLabel(
+            self.keywords_tab,
+            text="No job description provided for comparison.",
+            wraplength=700,
+            justify="left",
+            anchor="w"
+        )
         self.matching_text.grid(row=1, column=0, padx=10, pady=5, sticky="ew")
-        self.matching_text.insert("1.0", "No job description provided for comparison.")
 
         # Missing Keywords
         missing_label = ctk.CTkLabel(
             self.keywords_tab,
             text="Missing Keywords:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         missing_label.grid(row=2, column=0, padx=10, pady=(10, 5), sticky="w")
 
-        self.missing_text = ctk.CTkTextbox(self.keywords_tab, height=100)
+        self.missing_text = ctk.CTkLabel(
+            self.keywords_tab,
+            text="No job description provided for comparison.",
+            wraplength=700,
+            justify="left",
+            anchor="w"
+        )
         self.missing_text.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
-        self.missing_text.insert("1.0", "No job description provided for comparison.")
 
         # Section Match Scores
         section_label = ctk.CTkLabel(
             self.keywords_tab,
             text="Section Match Scores:",
-            font=ctk.CTkFont(weight="bold")
+            font=_font(weight="bold")
         )
         section_label.grid(row=4, column=0, padx=10, pady=(10, 5), sticky="w")
 
-        self.section_text = ctk.CTkTextbox(self.keywords_tab, height=100)
+        self.section_text = ctk.CTkLabel(
+            self.keywords_tab,
+            text="No analysis has been performed yet.",
+            wraplength=700,
+            justify="left",
+            anchor="w"
+        )
         self.section_text.grid(row=5, column=0, padx=10, pady=5, sticky="ew")
-        self.section_text.insert("1.0", "No analysis has been performed yet.")
 
     def _setup_resume_tab(self):
         """Set up the resume content tab"""
@@ -519,53 +551,19 @@ class MainView(ctk.CTk):
         self.resume_scroll.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.resume_scroll.grid_columnconfigure(0, weight=1)
 
-        # Contact Info
-        contact_label = ctk.CTkLabel(
-            self.resume_scroll,
-            text="Contact Information:",
-            font=ctk.CTkFont(weight="bold")
-        )
-        contact_label.grid(row=0, column=0, padx=5, pady=(5, 0), sticky="w")
-
-        self.contact_text = ctk.CTkTextbox(self.resume_scroll, height=80)
-        self.contact_text.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
-        self.contact_text.insert("1.0", "No data available")
-
-        # Skills
-        skills_label = ctk.CTkLabel(
-            self.resume_scroll,
-            text="Skills:",
-            font=ctk.CTkFont(weight="bold")
-        )
-        skills_label.grid(row=2, column=0, padx=5, pady=(10, 0), sticky="w")
-
-        self.skills_text = ctk.CTkTextbox(self.resume_scroll, height=80)
-        self.skills_text.grid(row=3, column=0, padx=5, pady=5, sticky="ew")
-        self.skills_text.insert("1.0", "No data available")
-
-        # Experience
-        experience_label = ctk.CTkLabel(
-            self.resume_scroll,
-            text="Experience:",
-            font=ctk.CTkFont(weight="bold")
-        )
-        experience_label.grid(row=4, column=0, padx=5, pady=(10, 0), sticky="w")
-
-        self.experience_text = ctk.CTkTextbox(self.resume_scroll, height=150)
-        self.experience_text.grid(row=5, column=0, padx=5, pady=5, sticky="ew")
-        self.experience_text.insert("1.0", "No data available")
-
-        # Education
-        education_label = ctk.CTkLabel(
-            self.resume_scroll,
-            text="Education:",
-            font=ctk.CTkFont(weight="bold")
-        )
-        education_label.grid(row=6, column=0, padx=5, pady=(10, 0), sticky="w")
+        # One label and textbox per field, stored as self.<attribute>
+        for i, (attribute, label_text, height) in enumerate(self._RESUME_FIELDS):
+            label = ctk.CTkLabel(
+                self.resume_scroll,
+                text=label_text,
+                font=_font(weight="bold")
+            )
+            label.grid(row=2 * i, column=0, padx=5, pady=(5 if i == 0 else 10, 0), sticky="w")
 
-        self.education_text = ctk.CTkTextbox(self.resume_scroll, height=80)
-        self.education_text.grid(row=7, column=0, padx=5, pady=5, sticky="ew")
-        self.education_text.insert("1.0", "No data available")
+            textbox = ctk.CTkTextbox(self.resume_scroll, height=height)
+            textbox.grid(row=2 * i + 1, column=0, padx=5, pady=5, sticky="ew")
+            textbox.insert("1.0", "No data available")
+            setattr(self, attribute, textbox)
 
     def browse_resume(self):
         """Open file dialog to select a resume file"""
@@ -599,30 +597,39 @@ class MainView(ctk.CTk):
         )
 
         if file_path:
-            try:
-                # Try to read the file as a text file first
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self.job_description_text.delete("1.0", "end")
-                    self.job_description_text.insert("1.0", content)
-            except:
-                messagebox.showinfo(
-                    "File Loading",
-                    "Could not read file as text. File path will be used directly."
-                )
-                self.job_description = file_path
+            # Read on the worker thread so large files do not freeze the UI
+            future = self._run_in_background(self._read_text_file, file_path)
+            self._after_future(future, lambda f: self._on_job_description_loaded(f, file_path))
+
+    @staticmethod
+    def _read_text_file(file_path):
+        """Read a file as UTF-8 text"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _on_job_description_loaded(self, future, file_path):
+        """Show a loaded job description file in the text box"""
+        try:
+            content = future.result()
+        except (OSError, UnicodeDecodeError):
+            messagebox.showinfo(
+                "File Loading",
+                "Could not read file as text. File path will be used directly."
+            )
+            self.job_description = file_path
+            return
+
+        self.job_description_text.delete("1.0", "end")
+        self.job_description_text.insert("1.0", content)
 
     def on_ats_selected(self, choice):
         """Handle ATS platform selection"""
         self.selected_ats = self.platform_ids.get(choice)
 
-        # Show platform description if available
-        for platform in self.controller.ats_checker.ats_rules.values():
-            if platform.get("name") == choice:
-                self.ats_info_label.configure(
-                    text=platform.get("description", "")
-                )
-                break
+        # Show platform description if available, skipping the relayout when unchanged
+        description = self.platform_info.get(choice)
+        if description is not None and description != self.ats_info_label.cget("text"):
+            self.ats_info_label.configure(text=description)
 
     def analyze_resume(self):
         """Start the resume analysis process"""
@@ -634,6 +641,19 @@ class MainView(ctk.CTk):
             messagebox.showerror("Error", "Please select a resume file first.")
             return
 
+        # Check the file before starting so a moved or deleted file fails immediately
+        try:
+            file_size = os.stat(self.resume_path).st_size
+        except OSError:
+            messagebox.showerror("Error", "The selected resume file could not be found.")
+            return
+
+        if file_size > self._LARGE_RESUME_BYTES:
+            messagebox.showwarning(
+                "Large File",
+                "This resume file is unusually large and may take a while to analyze."
+            )
+
         # Get job description from text box
         job_description = self.job_description_text.get("1.0", "end").strip()
         if not job_description:
@@ -648,41 +668,57 @@ class MainView(ctk.CTk):
         # Disable analysis button
         self.analyze_button.configure(state="disabled", text="Analyzing...")
 
-        # Run analysis in a separate thread to keep UI responsive
-        threading.Thread(target=self._run_analysis, args=(job_description,), daemon=True).start()
+        # Run analysis on the worker thread to keep UI responsive
+        self.update_progress(0.2, "Parsing resume...")
+        future = self._run_in_background(
+            self.controller.analyze_resume,
+            self.resume_path,
+            job_description,
+            self.selected_ats
+        )
+        self._after_future(future, self._finalize_analysis)
 
-    def _run_analysis(self, job_description):
-        """Run the analysis process in a background thread"""
-        try:
-            # Update progress
-            self.update_progress(0.2, "Parsing resume...")
-            time.sleep(0.5)  # Small delay for UI feedback
-
-            # Run analysis
-            results = self.controller.analyze_resume(
-                self.resume_path,
-                job_description,
-                self.selected_ats
-            )
+    def _run_in_background(self, func, *args):
+        """Run func(*args) on a daemon thread and return a Future for its result"""
+        # Daemon threads so closing the window exits even mid-analysis;
+        # results are picked up on the Tk thread via _after_future
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
 
-            self.update_progress(0.8, "Processing results...")
+        threading.Thread(target=run, daemon=True).start()
+        return future
 
-            # Store results and update UI
-            self.analysis_results = results
-            self.after(100, lambda: self.display_results(results))
+    def _after_future(self, future, callback):
+        """Call callback(future) on the Tk thread once the background task finishes"""
+        if future.done():
+            callback(future)
+        else:
+            self.after(10, self._after_future, future, callback)
 
+    def _finalize_analysis(self, future):
+        """Single completion handler for an analysis: show the results or the error"""
+        try:
+            results = future.result()
         except Exception as e:
             logger.error(f"Analysis error: {e}")
-            self.after(100, lambda: messagebox.showerror("Analysis Error", str(e)))
-            self.after(100, self.reset_analysis_ui)
+            messagebox.showerror("Analysis Error", str(e))
+            self.reset_analysis_ui()
+            return
+
+        # Store results and update UI; display_results resets the UI when done
+        self.analysis_results = results
+        self.display_results(results)
 
     def update_progress(self, value, message=None):
-        """Update progress bar and message"""
-        def _update():
-            self.progress_bar.set(value)
-            if message:
-                self.progress_label.configure(text=message)
-        self.after(10, _update)
+        """Update progress bar and message (call from the Tk thread)"""
+        self.progress_bar.set(value)
+        if message:
+            self.progress_label.configure(text=message)
 
     def reset_analysis_ui(self):
         """Reset UI after analysis completes or fails"""
@@ -715,18 +751,17 @@ class MainView(ctk.CTk):
             # Update summary tab
             self.ats_score_value.configure(
                 text=f"{ats_analysis.get('compatibility_score', 0)}%",
-                text_color=self._get_score_color(ats_analysis.get('compatibility_score', 0))
+                text_color=_score_color(ats_analysis.get('compatibility_score', 0))
             )
 
             if keyword_analysis:
                 self.match_score_value.configure(
                     text=f"{keyword_analysis.get('overall_match_percentage', 0)}%",
-                    text_color=self._get_score_color(keyword_analysis.get('overall_match_percentage', 0))
+                    text_color=_score_color(keyword_analysis.get('overall_match_percentage', 0))
                 )
 
             # Update summary text
-            self.summary_text.delete("1.0", "end")
-            self.summary_text.insert("1.0", feedback.get("summary", "No summary feedback available."))
+            self._set_text(self.summary_text, feedback.get("summary", "No summary feedback available."))
 
             # Show OCR notice if applicable
             if results.get("ocr_used"):
@@ -739,43 +774,33 @@ class MainView(ctk.CTk):
             # Update ATS tab
             self.platform_value.configure(text=ats_analysis.get("ats_platform", "Default"))
 
-            self.issues_text.delete("1.0", "end")
             issues = ats_analysis.get("formatting_issues", [])
-            if issues:
-                self.issues_text.insert("1.0", "\n".join(f"• {issue}" for issue in issues))
-            else:
-                self.issues_text.insert("1.0", "No formatting issues detected.")
+            self._set_text(self.issues_text, _bullets(issues) or "No formatting issues detected.")
 
-            self.recommendations_text.delete("1.0", "end")
             recommendations = ats_analysis.get("improvement_suggestions", [])
-            if recommendations:
-                self.recommendations_text.insert("1.0", "\n".join(f"• {rec}" for rec in recommendations))
-            else:
-                self.recommendations_text.insert("1.0", "No specific recommendations provided.")
+            self._set_text(
+                self.recommendations_text,
+                _bullets(recommendations) or "No specific recommendations provided."
+            )
 
             # Update keywords tab
             if keyword_analysis:
-                self.matching_text.delete("1.0", "end")
                 matching = keyword_analysis.get("matching_keywords", [])
-                if matching:
-                    self.matching_text.insert("1.0", ", ".join(matching[:20]))
-                else:
-                    self.matching_text.insert("1.0", "No matching keywords found.")
+                self.matching_text.configure(
+                    text=", ".join(matching[:20]) if matching else "No matching keywords found."
+                )
 
-                self.missing_text.delete("1.0", "end")
                 missing = keyword_analysis.get("missing_keywords", [])
-                if missing:
-                    self.missing_text.insert("1.0", ", ".join(missing[:20]))
-                else:
-                    self.missing_text.insert("1.0", "No missing keywords identified.")
+                self.missing_text.configure(
+                    text=", ".join(missing[:20]) if missing else "No missing keywords identified."
+                )
 
                 # Add section match scores
-                self.section_text.delete("1.0", "end")
                 section_text = f"Overall Match: {keyword_analysis.get('overall_match_percentage', 0)}%\n"
                 section_text += f"Skills Match: {keyword_analysis.get('skills_match_percentage', 0)}%\n"
                 section_text += f"Experience Match: {keyword_analysis.get('experience_match_percentage', 0)}%\n"
                 section_text += f"Education Match: {keyword_analysis.get('education_match_percentage', 0)}%"
-                self.section_text.insert("1.0", section_text)
+                self.section_text.configure(text=section_text)
 
             # Update resume content tab
             self._update_contact_info(resume_data.get("contact_info", {}))
@@ -786,8 +811,14 @@ class MainView(ctk.CTk):
             # Update visualization
             self._create_visualization(results.get("scores", {}))
 
-            # Prepare comprehensive feedback
-            self._prepare_comprehensive_feedback(feedback, results)
+            # Comprehensive feedback is rendered when the panel is opened,
+            # unless it is already on screen
+            self._pending_feedback = (feedback, results)
+            if self.feedback_frame is not None and self.feedback_frame.winfo_viewable():
+                self._render_pending_feedback()
+
+            # Flush all pending redraws once rather than per widget
+            self.update_idletasks()
 
         except Exception as e:
             logger.error(f"Error displaying results: {e}")
@@ -798,12 +829,12 @@ class MainView(ctk.CTk):
 
     def _create_visualization(self, scores):
         """Create visualization of analysis scores"""
-        # Clear existing chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(8, 4))
+        # Reuse the existing figure instead of rebuilding the canvas
+        if self._fig is None:
+            self._create_chart_figure()
+        fig, ax = self._fig, self._ax
+        ax.clear()
+        ax.set_axis_on()
         fig.patch.set_facecolor('none')  # Transparent background
 
         # Prepare data
@@ -824,22 +855,19 @@ class MainView(ctk.CTk):
             ])
 
         # Set colors based on scores
-        colors = [self._get_bar_color(value) for value in values]
+        colors = list(map(_score_color, values))
 
         # Create chart
         bars = ax.bar(categories, values, color=colors)
 
         # Add score labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width()/2.,
-                height + 2,
-                f'{height}%',
-                ha='center',
-                fontsize=10,
-                fontweight='bold'
-            )
+        ax.bar_label(
+            bars,
+            labels=[f'{value}%' for value in values],
+            padding=3,
+            fontsize=10,
+            fontweight='bold'
+        )
 
         # Customize chart appearance
         ax.set_ylim(0, 105)  # Leave room for labels
@@ -851,184 +879,219 @@ class MainView(ctk.CTk):
         ax.axhline(y=70, color='gray', linestyle='--', alpha=0.7)
         ax.text(len(categories)-1, 72, 'Target (70%)', ha='right', fontsize=8, style='italic')
 
-        # Create canvas and embed in frame
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill=tk.BOTH, expand=True)
+        # Redraw the embedded canvas
+        fig.canvas.draw_idle()
 
-    def _get_score_color(self, score):
-        """Return color based on score value"""
-        if score >= 80:
-            return "#4CAF50"  # Green
-        elif score >= 60:
-            return "#FF9800"  # Orange
-        else:
-            return "#F44336"  # Red
-
-    def _get_bar_color(self, value):
-        """Return bar color based on score value"""
-        if value >= 80:
-            return "#4CAF50"  # Green
-        elif value >= 60:
-            return "#FF9800"  # Orange
-        else:
-            return "#F44336"  # Red
+    def _set_text(self, textbox, text):
+        """Replace the full contents of a textbox"""
+        # Re-rendering identical results leaves the widget untouched
+        current = textbox.get("1.0", "end-1c")
+        if current == text:
+            return
+        if len(text) < self._DIFF_MIN_CHARS:
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", text)
+            return
+
+        # Longer texts: only replace the span between the common prefix and suffix
+        prefix = len(os.path.commonprefix((current, text)))
+        suffix = len(os.path.commonprefix((current[prefix:][::-1], text[prefix:][::-1])))
+        start = _tk_index(current[:prefix])
+        textbox.delete(start, _tk_index(current[:len(current) - suffix]))
+        textbox.insert(start, text[prefix:len(text) - suffix])
+
+    def _tag_configure_font(self, textbox, tag, font):
+        """Set the font of a text tag"""
+        # CTkTextbox.tag_config rejects font= (it would bypass widget scaling),
+        # so this configures the wrapped tk.Text (private _textbox) directly
+        textbox._textbox.tag_configure(tag, font=font)
+
+    def _tag_add_ranges(self, textbox, tag, ranges):
+        """Apply tag to all (start, end, start, end, ...) index pairs in one call"""
+        # CTkTextbox.tag_add only forwards a single range, so this goes to the
+        # wrapped tk.Text (private _textbox); a customtkinter upgrade that
+        # renames it only needs fixing here
+        textbox._textbox.tag_add(tag, *ranges)
 
     def _update_contact_info(self, contact_info):
         """Update contact information display"""
-        self.contact_text.delete("1.0", "end")
-        text = f"Name: {contact_info.get('name', 'Not found')}\n"
-        text += f"Email: {contact_info.get('email', 'Not found')}\n"
-        text += f"Phone: {contact_info.get('phone', 'Not found')}\n"
+        parts = [f"{label}: {contact_info.get(key, 'Not found')}\n"
+                 for key, label in self._CONTACT_REQUIRED]
+        for key, label in self._CONTACT_OPTIONAL:
+            value = contact_info.get(key)
+            if value:
+                parts.append(f"{label}: {value}\n")
 
-        if contact_info.get('linkedin'):
-            text += f"LinkedIn: {contact_info.get('linkedin')}\n"
-        if contact_info.get('github'):
-            text += f"GitHub: {contact_info.get('github')}\n"
-        if contact_info.get('location'):
-            text += f"Location: {contact_info.get('location')}\n"
-
-        self.contact_text.insert("1.0", text)
+        self._set_text(self.contact_text, "".join(parts))
 
     def _update_skills(self, skills):
         """Update skills display"""
-        self.skills_text.delete("1.0", "end")
-        if skills:
-            self.skills_text.insert("1.0", ", ".join(skills))
-        else:
-            self.skills_text.insert("1.0", "No skills identified in resume.")
+        self._set_text(self.skills_text, ", ".join(skills) if skills else "No skills identified in resume.")
 
     def _update_experience(self, experience_list):
         """Update experience display"""
-        self.experience_text.delete("1.0", "end")
         if not experience_list:
-            self.experience_text.insert("1.0", "No experience entries found.")
+            self._set_text(self.experience_text, "No experience entries found.")
             return
 
-        text = ""
-        for i, exp in enumerate(experience_list):
-            if i > 0:
-                text += "\n\n"
-
-            if exp.get('title'):
-                text += f"Title: {exp.get('title')}\n"
-            if exp.get('company'):
-                text += f"Company: {exp.get('company')}\n"
-            if exp.get('date_range'):
-                text += f"Period: {exp.get('date_range')}\n"
-
-            if exp.get('description'):
-                text += f"\n{exp.get('description')}"
-
-        self.experience_text.insert("1.0", text)
+        entries = []
+        for exp in experience_list:
+            entry_parts = []
+            title = exp.get('title')
+            if title:
+                entry_parts.append(f"Title: {title}\n")
+            company = exp.get('company')
+            if company:
+                entry_parts.append(f"Company: {company}\n")
+            date_range = exp.get('date_range')
+            if date_range:
+                entry_parts.append(f"Period: {date_range}\n")
+
+            description = exp.get('description')
+            if description:
+                entry_parts.append(f"\n{description}")
+            entries.append("".join(entry_parts))
+
+        self._set_text(self.experience_text, "\n\n".join(entries))
 
     def _update_education(self, education_list):
         """Update education display"""
-        self.education_text.delete("1.0", "end")
         if not education_list:
-            self.education_text.insert("1.0", "No education entries found.")
+            self._set_text(self.education_text, "No education entries found.")
             return
 
-        text = ""
-        for i, edu in enumerate(education_list):
-            if i > 0:
-                text += "\n\n"
-
-            if edu.get('degree'):
-                text += f"Degree: {edu.get('degree')}\n"
-            if edu.get('institution'):
-                text += f"Institution: {edu.get('institution')}\n"
-            if edu.get('date_range'):
-                text += f"Period: {edu.get('date_range')}"
-
-        self.education_text.insert("1.0", text)
+        entries = []
+        for edu in education_list:
+            entry_parts = []
+            degree = edu.get('degree')
+            if degree:
+                entry_parts.append(f"Degree: {degree}\n")
+            institution = edu.get('institution')
+            if institution:
+                entry_parts.append(f"Institution: {institution}\n")
+            date_range = edu.get('date_range')
+            if date_range:
+                entry_parts.append(f"Period: {date_range}")
+            entries.append("".join(entry_parts))
+
+        self._set_text(self.education_text, "\n\n".join(entries))
 
     def _prepare_comprehensive_feedback(self, feedback, results):
         """Prepare comprehensive feedback for detailed view"""
-        self.feedback_text.delete("1.0", "end")
+        if self.feedback_frame is None:
+            try:
+                self.create_feedback_panel()
+            except Exception:
+                # Don't leave a half-built window behind for the next attempt
+                if self.feedback_frame is not None:
+                    self.feedback_frame.destroy()
+                    self.feedback_frame = None
+                raise
+
+        # Build the whole text first and insert it once; tagged ranges are
+        # recorded as Tk character offsets and applied after the insert
+        buf = io.StringIO()
+        tagged = {"heading": [], "subheading": []}
+        offset = 0
+
+        def add(text, tag=None):
+            nonlocal offset
+            length = _tk_len(text)
+            if tag:
+                tagged[tag] += (f"1.0+{offset}c", f"1.0+{offset + length}c")
+            buf.write(text)
+            offset += length
+
+        def add_heading(header):
+            title, rule = header
+            add(title, "heading")
+            add(rule)
 
         # Add summary
-        self.feedback_text.insert("end", "SUMMARY FEEDBACK\n", "heading")
-        self.feedback_text.insert("end", "================\n\n")
-        self.feedback_text.insert("end", f"{feedback.get('summary', 'No summary available.')}\n\n\n")
+        add_heading(_HDR_SUMMARY)
+        add(f"{feedback.get('summary', 'No summary available.')}\n\n")
 
         # Add ATS compatibility feedback
-        self.feedback_text.insert("end", "ATS COMPATIBILITY\n", "heading")
-        self.feedback_text.insert("end", "================\n\n")
+        add_heading(_HDR_ATS)
 
         ats_feedback = feedback.get("ats_compatibility", {})
-        self.feedback_text.insert("end", f"Score: {ats_feedback.get('score', 0)}%\n\n")
+        add(f"Score: {ats_feedback.get('score', 0)}%\n\n")
 
-        if ats_feedback.get("issues"):
-            self.feedback_text.insert("end", "Issues:\n")
-            for issue in ats_feedback.get("issues", []):
-                self.feedback_text.insert("end", f"• {issue}\n")
-            self.feedback_text.insert("end", "\n")
+        issues = ats_feedback.get("issues")
+        if issues:
+            add(_render_bullets("Issues:", tuple(issues)))
 
-        if ats_feedback.get("recommendations"):
-            self.feedback_text.insert("end", "Recommendations:\n")
-            for rec in ats_feedback.get("recommendations", []):
-                self.feedback_text.insert("end", f"• {rec}\n")
-            self.feedback_text.insert("end", "\n\n")
+        ats_recommendations = ats_feedback.get("recommendations")
+        if ats_recommendations:
+            add(_render_bullets("Recommendations:", tuple(ats_recommendations)))
 
         # Add content quality feedback
-        self.feedback_text.insert("end", "CONTENT QUALITY\n", "heading")
-        self.feedback_text.insert("end", "==============\n\n")
+        add_heading(_HDR_CONTENT)
 
         content_feedback = feedback.get("content_quality", {})
 
-        if content_feedback.get("strengths"):
-            self.feedback_text.insert("end", "Strengths:\n")
-            for strength in content_feedback.get("strengths", []):
-                self.feedback_text.insert("end", f"• {strength}\n")
-            self.feedback_text.insert("end", "\n")
+        strengths = content_feedback.get("strengths")
+        if strengths:
+            add(_render_bullets("Strengths:", tuple(strengths)))
 
-        if content_feedback.get("weaknesses"):
-            self.feedback_text.insert("end", "Areas for Improvement:\n")
-            for weakness in content_feedback.get("weaknesses", []):
-                self.feedback_text.insert("end", f"• {weakness}\n")
-            self.feedback_text.insert("end", "\n")
+        weaknesses = content_feedback.get("weaknesses")
+        if weaknesses:
+            add(_render_bullets("Areas for Improvement:", tuple(weaknesses)))
 
-        if content_feedback.get("recommendations"):
-            self.feedback_text.insert("end", "Recommendations:\n")
-            for rec in content_feedback.get("recommendations", []):
-                self.feedback_text.insert("end", f"• {rec}\n")
-            self.feedback_text.insert("end", "\n\n")
+        content_recommendations = content_feedback.get("recommendations")
+        if content_recommendations:
+            add(_render_bullets("Recommendations:", tuple(content_recommendations)))
 
         # Add keyword match feedback if available
         keyword_feedback = feedback.get("keyword_match", {})
         if keyword_feedback and "score" in keyword_feedback:
-            self.feedback_text.insert("end", "KEYWORD MATCHING\n", "heading")
-            self.feedback_text.insert("end", "===============\n\n")
-            self.feedback_text.insert("end", f"Score: {keyword_feedback.get('score', 0)}%\n\n")
+            add_heading(_HDR_KEYWORDS)
+            add(f"Score: {keyword_feedback['score']}%\n\n")
 
-            if keyword_feedback.get("recommendations"):
-                self.feedback_text.insert("end", "Recommendations:\n")
-                for rec in keyword_feedback.get("recommendations", []):
-                    self.feedback_text.insert("end", f"• {rec}\n")
-                self.feedback_text.insert("end", "\n\n")
+            keyword_recommendations = keyword_feedback.get("recommendations")
+            if keyword_recommendations:
+                add(_render_bullets("Recommendations:", tuple(keyword_recommendations)))
 
         # Add section-by-section feedback
-        self.feedback_text.insert("end", "SECTION-BY-SECTION FEEDBACK\n", "heading")
-        self.feedback_text.insert("end", "==========================\n\n")
+        add_heading(_HDR_SECTIONS)
 
         section_feedback = results.get("section_feedback", {})
         for section_name, feedback_items in section_feedback.items():
-            display_name = section_name.replace("_", " ").title()
-            self.feedback_text.insert("end", f"{display_name} Section:\n", "subheading")
-
-            for item in feedback_items:
-                self.feedback_text.insert("end", f"• {item}\n")
-
-            self.feedback_text.insert("end", "\n")
-
-        # Configure tags for formatting
-        self.feedback_text.tag_configure("heading", font=ctk.CTkFont(size=16, weight="bold"))
-        self.feedback_text.tag_configure("subheading", font=ctk.CTkFont(size=14, weight="bold"))
+            display_name = _section_display_name(section_name)
+            add(f"{display_name} Section:\n", "subheading")
+            if feedback_items:
+                add(_bullets(feedback_items) + "\n")
+            add("\n")
+
+        # Write everything while editable, then lock the textbox read-only
+        self.feedback_text.configure(state="normal")
+        self._set_text(self.feedback_text, buf.getvalue())
+        for tag, ranges in tagged.items():
+            self.feedback_text.tag_remove(tag, "1.0", "end")
+            if ranges:
+                self._tag_add_ranges(self.feedback_text, tag, ranges)
+        self.feedback_text.configure(state="disabled")
+
+    def _render_pending_feedback(self):
+        """Render feedback stored by display_results; returns False if rendering failed"""
+        if self._pending_feedback is None:
+            return True
+        try:
+            feedback, results = self._pending_feedback
+            self._prepare_comprehensive_feedback(feedback, results)
+        except Exception as e:
+            # Keep the feedback pending so the next attempt renders it again
+            logger.error(f"Error displaying feedback: {e}")
+            messagebox.showerror("Display Error", f"Error displaying feedback: {str(e)}")
+            return False
+        self._pending_feedback = None
+        return True
 
     def show_feedback_panel(self):
         """Display the comprehensive feedback panel"""
-        if self.analysis_results:
+        if not self._render_pending_feedback():
+            return
+        if self.analysis_results and self.feedback_frame is not None:
             self.feedback_frame.deiconify()
             self.feedback_frame.focus_set()
         else: